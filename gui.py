@@ -1,7 +1,9 @@
 import os
 import sys
 import math
+import asyncio
 import shutil
+import sqlite3
 import threading
 import time
 import webbrowser
@@ -60,16 +62,219 @@ def files_identical(src_path, dst_path):
             s_size == d_size and
             s_mtime == d_mtime)
 
-def next_available_name(dst_dir, filename):
-    """Return a non-colliding filename by adding -1, -2, ... before extension."""
+def next_available_name(dst_dir, filename, reserved=()):
+    """Return a non-colliding filename by adding -1, -2, ... before extension.
+
+    Names in `reserved` are treated as taken even if not yet on disk
+    (e.g. moves still queued in the pipeline).
+    """
     base, ext = os.path.splitext(filename)
     candidate = filename
     counter = 1
-    while os.path.exists(os.path.join(dst_dir, candidate)):
+    while candidate in reserved or os.path.exists(os.path.join(dst_dir, candidate)):
         candidate = f"{base}-{counter}{ext}"
         counter += 1
     return candidate
 
+def list_top_level_files(src_dir):
+    """Return names of regular files directly inside src_dir (no subfolders)."""
+    return [f for f in os.listdir(src_dir) if os.path.isfile(os.path.join(src_dir, f))]
+
+def same_volume(src_path, dst_dir):
+    """True if src_path and dst_dir are on one filesystem (a move there is just a rename)."""
+    try:
+        return os.stat(src_path).st_dev == os.stat(dst_dir).st_dev
+    except Exception:
+        return False
+
+def parse_folder_list(text):
+    """Split a ';'-separated folder list, dropping blanks."""
+    return [p.strip() for p in text.split(";") if p.strip()]
+
+# ----------------------------
+# Pipeline settings
+# ----------------------------
+PIPELINE_QUEUE_SIZE = 64   # max items buffered between stages (bounds memory)
+FANOUT_CHUNK_SIZE = 1024 * 1024  # read size when copying one source to several destinations
+_PIPELINE_DONE = object()  # end-of-stream sentinel passed down the stages
+HISTORY_BATCH_SIZE = 500   # file rows buffered before each run-history insert
+
+# ----------------------------
+# Run history (SQLite)
+# ----------------------------
+def default_history_path():
+    """Per-user location of the run history database."""
+    return os.path.join(os.path.expanduser("~"), ".ragilmalik-gui-mover", "run-history.sqlite3")
+
+class RunHistory:
+    """
+    Local SQLite store of past runs: one row per run (totals, duration, bytes copied)
+    plus one row per logged file action, indexed by filename and folders.
+    Each call opens its own connection, so the worker thread and the UI can
+    both use the same instance; the schema is created on first use only.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at REAL NOT NULL,
+            duration REAL,  -- NULL until the run finishes
+            mode TEXT NOT NULL,
+            src_dir TEXT NOT NULL,
+            dst_dirs TEXT NOT NULL,
+            total INTEGER NOT NULL DEFAULT 0,
+            moved INTEGER NOT NULL DEFAULT 0,
+            skipped INTEGER NOT NULL DEFAULT 0,
+            errors INTEGER NOT NULL DEFAULT 0,
+            bytes INTEGER NOT NULL DEFAULT 0,  -- bytes copied; same-volume renames add 0
+            log_path TEXT
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            ts REAL NOT NULL,
+            action TEXT NOT NULL,
+            src_dir TEXT NOT NULL COLLATE NOCASE,
+            dst_dir TEXT NOT NULL COLLATE NOCASE,
+            filename TEXT NOT NULL COLLATE NOCASE,
+            new_filename TEXT NOT NULL COLLATE NOCASE,
+            size INTEGER NOT NULL,
+            note TEXT NOT NULL
+        );
+        -- NOCASE indexes let the prefix LIKE in search_files use them
+        CREATE INDEX IF NOT EXISTS idx_files_filename ON files(filename);
+        CREATE INDEX IF NOT EXISTS idx_files_new_filename ON files(new_filename);
+        CREATE INDEX IF NOT EXISTS idx_files_src_dir ON files(src_dir);
+        CREATE INDEX IF NOT EXISTS idx_files_dst_dir ON files(dst_dir);
+        CREATE INDEX IF NOT EXISTS idx_files_run_id ON files(run_id);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._schema_ready = False
+
+    def _connect(self, check_same_thread=True):
+        if not self._schema_ready:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not self._schema_ready:
+            conn.executescript(self.SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def begin_run(self, started_at, mode, src_dir, dst_dirs, log_path=None):
+        """Insert the run row and return a RunRecorder that streams its file rows."""
+        # The recorder's connection is used from the worker's executor threads
+        # (one call at a time), hence check_same_thread=False.
+        conn = self._connect(check_same_thread=False)
+        try:
+            with conn:
+                cur = conn.execute(
+                    "INSERT INTO runs (started_at, mode, src_dir, dst_dirs, log_path) VALUES (?, ?, ?, ?, ?)",
+                    (started_at, mode, src_dir, "; ".join(dst_dirs), log_path),
+                )
+        except Exception:
+            conn.close()
+            raise
+        return RunRecorder(conn, cur.lastrowid)
+
+    def recent_runs(self, limit=30, mode=None):
+        """Return the last `limit` finished runs (optionally only `mode`), oldest first, as dicts."""
+        sql = "SELECT * FROM runs WHERE duration IS NOT NULL"
+        params = []
+        if mode:
+            sql += " AND mode = ?"
+            params.append(mode)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return [dict(r) for r in reversed(rows)]
+
+    def search_files(self, term, limit=500):
+        """
+        Newest file rows whose filename, new filename or folder starts with
+        `term` (case-insensitive; all rows if empty). Prefix matching keeps
+        the lookups on the indexes instead of scanning every row.
+        """
+        select = ("SELECT runs.started_at, files.action, files.filename, files.new_filename,"
+                  " files.src_dir, files.dst_dir, files.size"
+                  " FROM files JOIN runs ON runs.id = files.run_id")
+        term = term.strip()
+        if term:
+            like = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            # Pick the newest matching ids from the covering NOCASE indexes
+            # first, then fetch only those rows. A plain WHERE ... OR with
+            # ORDER BY files.id lets the planner scan all of files instead.
+            sql = (select + " WHERE files.id IN ("
+                   "SELECT id FROM files WHERE filename LIKE ? ESCAPE '\\'"
+                   " UNION SELECT id FROM files WHERE new_filename LIKE ? ESCAPE '\\'"
+                   " UNION SELECT id FROM files WHERE src_dir LIKE ? ESCAPE '\\'"
+                   " UNION SELECT id FROM files WHERE dst_dir LIKE ? ESCAPE '\\'"
+                   " ORDER BY 1 DESC LIMIT ?)"
+                   " ORDER BY files.id DESC")
+            params = [like] * 4 + [limit]
+        else:
+            sql = select + " ORDER BY files.id DESC LIMIT ?"
+            params = [limit]
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+class RunRecorder:
+    """
+    Streams one run's file rows into the history in batches of
+    HISTORY_BATCH_SIZE, so memory doesn't grow with the file count and an
+    interrupted run keeps what it had recorded. finish() fills in the totals.
+    """
+    def __init__(self, conn, run_id):
+        self.conn = conn
+        self.run_id = run_id
+        self.failed = False  # set once a write fails; later rows are dropped
+        self._pending = []
+
+    def add(self, ts, action, src_dir, dst_dir, filename, new_filename, size, note):
+        """Buffer one row; returns True when a flush() is due."""
+        self._pending.append((self.run_id, ts, action, src_dir, dst_dir, filename, new_filename, size, note))
+        return len(self._pending) >= HISTORY_BATCH_SIZE
+
+    def flush(self):
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO files (run_id, ts, action, src_dir, dst_dir, filename, new_filename,"
+                " size, note) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def finish(self, duration, stats):
+        self.flush()
+        with self.conn:
+            self.conn.execute(
+                "UPDATE runs SET duration = ?, total = ?, moved = ?, skipped = ?, errors = ?, bytes = ?"
+                " WHERE id = ?",
+                (duration, stats["total"], stats["moved"], stats["skipped"], stats["errors"],
+                 stats["bytes"], self.run_id),
+            )
+
+    def close(self):
+        """Flush what's buffered (best effort) and close the connection."""
+        try:
+            if not self.failed:
+                self.flush()
+        except Exception:
+            pass
+        finally:
+            self.conn.close()
+
 # ----------------------------
 # Main App
 # ----------------------------
@@ -77,12 +282,13 @@ class MoveApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Ragilmalik's Python GUI Mover")
-        self.root.geometry("980x660")
-        self.root.minsize(860, 580)
+        self.root.geometry("980x720")
+        self.root.minsize(860, 620)
 
         # Vars
         self.src_var = StringVar()
         self.dst_var = StringVar()
+        self.extra_dst_var = StringVar()            # ';'-separated extra destinations
         self.status_var = StringVar(value="Ready")
         self.dry_run_var = BooleanVar(value=True)   # Simulation Only default ON
         self.theme_var = StringVar(value="Dark")    # default theme
@@ -90,6 +296,7 @@ class MoveApp:
         self.csv_custom_dir = StringVar(value="")   # custom dir path
         self._worker_thread = None
         self._last_log_path = None  # .xlsx path
+        self.history = RunHistory(default_history_path())
 
         # Styling / theme
         self._setup_style_palettes()
@@ -230,10 +437,27 @@ class MoveApp:
                        background=[("active", p["picker_highlight_bg"])],
                        foreground=[("active", p["picker_highlight_fg"])])
 
+        # Notebook tabs + history table
+        self.style.configure("TNotebook", background=p["bg"], borderwidth=0)
+        self.style.configure("TNotebook.Tab", background=p["panel"], foreground=p["muted"], padding=(12, 4))
+        self.style.map("TNotebook.Tab",
+                       background=[("selected", p["card"])],
+                       foreground=[("selected", p["text"])])
+        self.style.configure("Treeview", background=p["text_bg"], fieldbackground=p["text_bg"], foreground=p["text_fg"])
+        self.style.configure("Treeview.Heading", background=p["panel"], foreground=p["text"])
+        self.style.map("Treeview",
+                       background=[("selected", p["picker_highlight_bg"])],
+                       foreground=[("selected", p["picker_highlight_fg"])])
+
         # If text widget already exists, update its colors
         if hasattr(self, "log") and isinstance(self.log, Text):
             self.log.config(bg=p["text_bg"], fg=p["text_fg"], insertbackground=p["text_ins"])
 
+        # Redraw history chart if exists
+        if hasattr(self, "trend"):
+            self.trend.config(bg=p["text_bg"])
+            self._draw_trend()
+
         # Redraw gradient if exists
         if hasattr(self, "grad"):
             self._draw_gradient(self.grad, p["gradient_from"], p["gradient_to"])
@@ -297,6 +521,14 @@ class MoveApp:
         self.dst_entry.pack(side=LEFT, padx=8, fill=X, expand=True)
         ttk.Button(row2, text="Browse…", command=self.browse_dst).pack(side=LEFT)
 
+        # Extra destinations (fan-out: each source file is read once, written to all)
+        row2b = ttk.Frame(card, style="Card.TFrame")
+        row2b.pack(fill=X, padx=12, pady=6)
+        ttk.Label(row2b, text="Extra Destinations (;):", font=self.font_ui).pack(side=LEFT)
+        self.extra_dst_entry = ttk.Entry(row2b, textvariable=self.extra_dst_var, width=80)
+        self.extra_dst_entry.pack(side=LEFT, padx=8, fill=X, expand=True)
+        ttk.Button(row2b, text="Add…", command=self.add_extra_dst).pack(side=LEFT)
+
         # Log location selector (xlsx)
         row3 = ttk.Frame(card, style="Card.TFrame")
         row3.pack(fill=X, padx=12, pady=(6, 0))
@@ -343,8 +575,11 @@ class MoveApp:
         self.status_label.pack(anchor="w", padx=12, pady=(0, 12))
 
     def _build_log(self):
-        logframe_outer = ttk.Frame(self.root, style="Card.TFrame")
-        logframe_outer.pack(fill=BOTH, expand=True, padx=16, pady=(0, 16))
+        self.tabs = ttk.Notebook(self.root)
+        self.tabs.pack(fill=BOTH, expand=True, padx=16, pady=(0, 16))
+
+        logframe_outer = ttk.Frame(self.tabs, style="Card.TFrame")
+        self.tabs.add(logframe_outer, text="Log")
 
         logframe = ttk.Frame(logframe_outer, style="Card.TFrame")
         logframe.pack(fill=BOTH, expand=True, padx=12, pady=12)
@@ -357,6 +592,47 @@ class MoveApp:
         vsb.pack(side=RIGHT, fill=Y)
         self.log.configure(yscrollcommand=vsb.set)
 
+        self._build_history()
+
+    def _build_history(self):
+        tab = ttk.Frame(self.tabs, style="Card.TFrame")
+        self.tabs.add(tab, text="History")
+        self.tabs.bind("<<NotebookTabChanged>>", self._on_tab_change)
+
+        # Throughput trend (files/s and MB/s per run)
+        p = self.palettes[self.theme_var.get()]
+        self.trend = Canvas(tab, height=150, highlightthickness=0, bd=0, bg=p["text_bg"])
+        self.trend.pack(fill=X, padx=12, pady=(12, 6))
+        self.trend.bind("<Configure>", lambda e: self._draw_trend())
+
+        # Search
+        row = ttk.Frame(tab, style="Card.TFrame")
+        row.pack(fill=X, padx=12, pady=6)
+        ttk.Label(row, text="Search (filename / folder starts with):", font=self.font_ui).pack(side=LEFT)
+        self.history_search_var = StringVar()
+        search = ttk.Entry(row, textvariable=self.history_search_var, width=60)
+        search.pack(side=LEFT, padx=8, fill=X, expand=True)
+        search.bind("<KeyRelease>", self._schedule_history_search)
+        ttk.Button(row, text="Refresh", command=self.refresh_history).pack(side=LEFT)
+
+        # Results
+        results = ttk.Frame(tab, style="Card.TFrame")
+        results.pack(fill=BOTH, expand=True, padx=12, pady=(6, 12))
+        columns = ("run", "action", "filename", "new_filename", "src", "dst", "size")
+        headings = ("Run Started", "Action", "Filename", "New Filename", "Source Folder", "Destination Folder", "Size")
+        widths = (140, 150, 180, 140, 200, 200, 70)
+        self.history_tree = ttk.Treeview(results, columns=columns, show="headings", height=8)
+        for col, heading, width in zip(columns, headings, widths):
+            self.history_tree.heading(col, text=heading)
+            self.history_tree.column(col, width=width, anchor="w", stretch=True)
+        self.history_tree.pack(side=LEFT, fill=BOTH, expand=True)
+        hvsb = ttk.Scrollbar(results, orient="vertical", command=self.history_tree.yview)
+        hvsb.pack(side=RIGHT, fill=Y)
+        self.history_tree.configure(yscrollcommand=hvsb.set)
+
+        self._history_runs = []
+        self._history_search_job = None
+
     # ---------- Gradient header ----------
     def _draw_gradient(self, canvas, color1, color2):
         """Draw a left→right minimal split gradient in the given canvas."""
@@ -368,6 +644,89 @@ class MoveApp:
         canvas.create_rectangle(w//2, 0, w, h, fill=color2, outline="", tags="grad")
         canvas.bind("<Configure>", lambda e: self._draw_gradient(canvas, color1, color2))
 
+    # ---------- History tab ----------
+    def _on_tab_change(self, _evt=None):
+        if self.tabs.index(self.tabs.select()) == 1:
+            self.refresh_history()
+
+    def refresh_history(self):
+        try:
+            # Live runs only: simulations move no data and would skew the scales
+            self._history_runs = self.history.recent_runs(mode="Live Run")
+        except Exception as e:
+            self._history_runs = []
+            self.status_var.set(f"Run history unavailable: {e}")
+        self._draw_trend()
+        self._search_history()
+
+    def _schedule_history_search(self, _evt=None):
+        """Debounce typing: search once the user pauses."""
+        if self._history_search_job:
+            self.root.after_cancel(self._history_search_job)
+        self._history_search_job = self.root.after(250, self._search_history)
+
+    def _search_history(self):
+        self._history_search_job = None
+        self.history_tree.delete(*self.history_tree.get_children())
+        try:
+            rows = self.history.search_files(self.history_search_var.get())
+        except Exception as e:
+            self.status_var.set(f"Run history unavailable: {e}")
+            return
+        for started_at, action, filename, new_filename, src_dir, dst_dir, size in rows:
+            size_text = f"{int(round(size / 1024.0))}KB" if size >= 0 else ""
+            self.history_tree.insert("", END, values=(
+                human_time(started_at), action, filename, new_filename, src_dir, dst_dir, size_text
+            ))
+
+    def _draw_trend(self):
+        """Per-run throughput: files/s as bars, MB copied/s as a line (each scaled to its own max)."""
+        canvas = self.trend
+        p = self.palettes[self.theme_var.get()]
+        canvas.delete("all")
+        w = canvas.winfo_width() or 900
+        h = canvas.winfo_height() or 150
+        runs = self._history_runs
+
+        if not runs:
+            canvas.create_text(w // 2, h // 2, text="No live runs recorded yet.", fill=p["muted"])
+            return
+
+        files_s = [r["total"] / r["duration"] if r["duration"] > 0 else 0.0 for r in runs]
+        mb_s = [r["bytes"] / (1024.0 * 1024.0) / r["duration"] if r["duration"] > 0 else 0.0 for r in runs]
+        max_f = max(files_s) or 1.0
+        max_m = max(mb_s) or 1.0
+
+        left, right, top, bottom = 12, 12, 26, 18
+        plot_w = max(w - left - right, 1)
+        plot_h = max(h - top - bottom, 1)
+        slot = plot_w / len(runs)
+
+        canvas.create_text(left, 4, anchor="nw", fill=p["accent"],
+                           text=f"■ files/s (max {max_f:.1f})")
+        canvas.create_text(left + 170, 4, anchor="nw", fill=p["btn_open"],
+                           text=f"● MB copied/s (max {max_m:.1f})")
+        canvas.create_text(w - right, 4, anchor="ne", fill=p["muted"],
+                           text=f"last {len(runs)} live runs")
+        canvas.create_line(left, top + plot_h, left + plot_w, top + plot_h, fill=p["muted"])
+
+        points = []
+        for i, (fs, ms) in enumerate(zip(files_s, mb_s)):
+            x0 = left + i * slot
+            bar_h = plot_h * fs / max_f
+            canvas.create_rectangle(x0 + slot * 0.2, top + plot_h - bar_h, x0 + slot * 0.8, top + plot_h,
+                                    fill=p["accent"], outline="")
+            points.append((x0 + slot / 2, top + plot_h - plot_h * ms / max_m))
+        if len(points) > 1:
+            canvas.create_line(*[c for pt in points for c in pt], fill=p["btn_open"], width=2)
+        for x, y in points:
+            canvas.create_oval(x - 3, y - 3, x + 3, y + 3, fill=p["btn_open"], outline="")
+
+        canvas.create_text(left, h - 2, anchor="sw", fill=p["muted"],
+                           text=human_time(runs[0]["started_at"]))
+        canvas.create_text(w - right, h - 2, anchor="se", fill=p["muted"],
+                           text=human_time(runs[-1]["started_at"]))
+
     # ---------- Picker highlight handling ----------
     def _on_theme_change(self, _evt=None):
         self.theme_var.set(self.theme_combo.get())
@@ -399,6 +758,14 @@ class MoveApp:
         if path:
             self.dst_var.set(path)
 
+    def add_extra_dst(self):
+        path = filedialog.askdirectory(title="Add Extra Destination Folder")
+        if path:
+            current = parse_folder_list(self.extra_dst_var.get())
+            if path not in current:
+                current.append(path)
+            self.extra_dst_var.set("; ".join(current))
+
     def clear_log(self):
         self.log.config(state=NORMAL)
         self.log.delete("1.0", END)
@@ -572,6 +939,20 @@ class MoveApp:
             messagebox.showerror("Error", "Source and destination folders must be different.")
             return
 
+        # Extra destinations (fan-out): each must be a distinct existing folder
+        dsts = [dst]
+        for extra in parse_folder_list(self.extra_dst_var.get()):
+            if not os.path.isdir(extra):
+                messagebox.showerror("Error", f"Extra destination does not exist or is not a directory:\n{extra}")
+                return
+            if os.path.abspath(extra) == os.path.abspath(src):
+                messagebox.showerror("Error", "Source and destination folders must be different.")
+                return
+            if any(os.path.abspath(extra) == os.path.abspath(d) for d in dsts):
+                messagebox.showerror("Error", f"Destination listed more than once:\n{extra}")
+                return
+            dsts.append(extra)
+
         # Resolve log folder *before* starting
         try:
             log_dir = self._resolve_log_dir(src, dst)
@@ -583,18 +964,21 @@ class MoveApp:
         mode = "DRY RUN" if self.dry_run_var.get() else "LIVE RUN"
         self.status_var.set(f"Preparing ({mode})…")
 
-        self.append_log(f"Starting {mode.lower()} from:\n  {src}\n→ {dst}\n(no subfolders)")
+        targets = "\n".join(f"→ {d}" for d in dsts)
+        self.append_log(f"Starting {mode.lower()} from:\n  {src}\n{targets}\n(no subfolders)")
         self.append_log(f"Excel log will be saved to: {log_dir}")
 
         # Start worker
         self._worker_thread = threading.Thread(
-            target=self._worker, args=(src, dst, log_dir, self.dry_run_var.get()), daemon=True
+            target=self._worker, args=(src, dsts, log_dir, self.dry_run_var.get()), daemon=True
         )
         self._worker_thread.start()
 
-    def _worker(self, src, dst, log_dir, dry_run):
+    def _worker(self, src, dsts, log_dir, dry_run):
         wb = None
         ws = None
+        all_dsts = "; ".join(dsts)
+        recorder = None
         try:
             try:
                 wb, ws, log_path = self._open_xlsx_log(log_dir)
@@ -602,88 +986,37 @@ class MoveApp:
                 self.append_log(f"WARNING: Could not create Excel log. {e}")
                 wb = ws = None
 
-            files = [f for f in os.listdir(src) if os.path.isfile(os.path.join(src, f))]
-            total = len(files)
-            moved = 0
-            skipped = 0
-            errors = 0
-
-            self.progress["value"] = 0
-            self.progress["maximum"] = total if total > 0 else 1
+            started = time.time()
+            recorder = self._begin_history(started, src, dsts, dry_run, ws)
+            stats = asyncio.run(self._run_pipeline(src, dsts, ws, dry_run, recorder))
+            duration = time.time() - started
+            total = stats["total"]
+            moved = stats["moved"]
+            skipped = stats["skipped"]
+            errors = stats["errors"]
 
             if total == 0:
                 self.append_log("No files found in source (top-level only). Nothing to do.")
                 self.status_var.set("Done (no files).")
                 if ws:
-                    self._write_log_row(ws, src, dst, "INFO", "", "", -1, -1, "No files to process")
+                    self._write_log_row(ws, src, all_dsts, "INFO", "", "", -1, -1, "No files to process")
                     self._autosize_columns(ws)
                     wb.save(self._last_log_path)
+                self._finish_history(recorder, duration, stats)
+                recorder = None
                 return
 
-            for idx, name in enumerate(files, start=1):
-                src_path = os.path.join(src, name)
-                planned_dst_same = os.path.join(dst, name)
-
-                try:
-                    s_name, s_ext, s_size, s_mtime, s_ctime = file_meta(src_path)
-
-                    if os.path.exists(planned_dst_same):
-                        if files_identical(src_path, planned_dst_same):
-                            msg = (f"SKIP: {name} (identical) "
-                                   f"[ext={s_ext}, size={s_size}, mtime={human_time(s_mtime)}]")
-                            self.append_log(msg)
-                            skipped += 1
-                            if ws:
-                                self._write_log_row(ws, src, dst, "SKIP", name, "", s_ctime, s_size, "Identical metadata")
-                        else:
-                            new_name = next_available_name(dst, name)
-                            final_dst = os.path.join(dst, new_name)
-                            if dry_run:
-                                self.append_log(f"DRYRUN: would move (renamed) {name} → {new_name}")
-                                moved += 1
-                                if ws:
-                                    self._write_log_row(ws, src, dst, "DRYRUN_MOVED_RENAMED", name, new_name, s_ctime, s_size, "Different metadata; rename required")
-                            else:
-                                shutil.move(src_path, final_dst)
-                                self.append_log(f"MOVED (renamed): {name} → {new_name}")
-                                moved += 1
-                                if ws:
-                                    self._write_log_row(ws, src, dst, "MOVED_RENAMED", name, new_name, s_ctime, s_size, "Different metadata; renamed")
-                    else:
-                        if dry_run:
-                            self.append_log(f"DRYRUN: would move {name}")
-                            moved += 1
-                            if ws:
-                                self._write_log_row(ws, src, dst, "DRYRUN_MOVED", name, "", s_ctime, s_size, "")
-                        else:
-                            shutil.move(src_path, planned_dst_same)
-                            self.append_log(f"MOVED: {name}")
-                            moved += 1
-                            if ws:
-                                self._write_log_row(ws, src, dst, "MOVED", name, "", s_ctime, s_size, "")
-                except Exception as e:
-                    errors += 1
-                    err_msg = f"ERROR moving {name}: {e}"
-                    self.append_log(err_msg)
-                    if ws:
-                        try:
-                            _, _, s_size, _, s_ctime = file_meta(src_path)
-                        except Exception:
-                            s_size, s_ctime = -1, -1
-                        self._write_log_row(ws, src, dst, "ERROR", name, "", s_ctime, s_size, str(e))
-
-                self.progress["value"] = idx
-                run_mode = "DRY RUN" if dry_run else "LIVE RUN"
-                self.status_var.set(f"{run_mode}: Processed {idx}/{total}…")
+            # moved/skipped/errors count one per file per destination
+            fan_out = f", destinations={len(dsts)}" if len(dsts) > 1 else ""
 
             # Empty row then SUMMARY row (bold)
             if ws:
                 ws.append([""] * 9)
                 summary_note = (
                     f"Summary — planned_or_moved={moved}, skipped={skipped}, "
-                    f"errors={errors}, total={total}; mode={'Simulation Only' if dry_run else 'Live Run'}"
+                    f"errors={errors}, total={total}{fan_out}; mode={'Simulation Only' if dry_run else 'Live Run'}"
                 )
-                self._write_log_row(ws, src, dst, "SUMMARY", "", "", -1, -1, summary_note)
+                self._write_log_row(ws, src, all_dsts, "SUMMARY", "", "", -1, -1, summary_note)
 
                 # Bold the entire SUMMARY row
                 summary_row_idx = ws.max_row
@@ -696,12 +1029,272 @@ class MoveApp:
                 wb.save(self._last_log_path)
                 self.append_log(f"Log saved: {self._last_log_path}")
 
+            self._finish_history(recorder, duration, stats)
+            recorder = None
+
             self.append_log("-" * 70)
-            self.append_log(f"Summary: planned_or_moved={moved}, skipped={skipped}, errors={errors}, total={total}")
+            self.append_log(f"Summary: planned_or_moved={moved}, skipped={skipped}, errors={errors}, total={total}{fan_out}")
             self.status_var.set("Done.")
         finally:
+            if recorder:
+                # Run was interrupted: keep the file rows recorded so far
+                recorder.close()
             self.set_running(False)
 
+    def _begin_history(self, started, src, dsts, dry_run, ws):
+        mode = "Simulation Only" if dry_run else "Live Run"
+        try:
+            return self.history.begin_run(started, mode, src, dsts, self._last_log_path if ws else None)
+        except Exception as e:
+            self.append_log(f"WARNING: Could not save run history. {e}")
+            return None
+
+    def _finish_history(self, recorder, duration, stats):
+        if not recorder:
+            return
+        try:
+            if not recorder.failed:
+                recorder.finish(duration, stats)
+        except Exception as e:
+            self.append_log(f"WARNING: Could not save run history. {e}")
+        finally:
+            recorder.close()
+        self.root.after(0, self.refresh_history)
+
+    # ---------- Move pipeline ----------
+    # scan → classify (skip/move/rename) → transfer → log, joined by bounded
+    # queues. Blocking filesystem calls run in the default executor so a slow
+    # transfer doesn't hold up classification of the files behind it.
+    async def _run_pipeline(self, src, dsts, ws, dry_run, recorder=None):
+        classify_q = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        transfer_q = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        log_q = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        # bytes feeds the run history: bytes actually copied (same-volume renames count 0)
+        stats = {"total": 0, "moved": 0, "skipped": 0, "errors": 0, "bytes": 0}
+        # Names already claimed by queued live moves, per destination; they
+        # aren't on disk yet, so collision checks must treat them as existing.
+        # The transfer stage releases a name again if its move fails.
+        reserved = {d: set() for d in dsts}
+
+        await asyncio.gather(
+            self._scan_stage(src, classify_q, stats),
+            self._classify_stage(src, dsts, dry_run, reserved, classify_q, transfer_q),
+            self._transfer_stage(len(dsts), reserved, transfer_q, log_q),
+            self._log_stage(src, ws, dry_run, recorder, log_q, stats),
+        )
+        return stats
+
+    async def _scan_stage(self, src, out_q, stats):
+        loop = asyncio.get_running_loop()
+        files = await loop.run_in_executor(None, list_top_level_files, src)
+        total = len(files)
+        stats["total"] = total
+
+        self.progress["value"] = 0
+        self.progress["maximum"] = total if total > 0 else 1
+
+        for name in files:
+            await out_q.put(name)
+        await out_q.put(_PIPELINE_DONE)
+
+    async def _classify_stage(self, src, dsts, dry_run, reserved, in_q, out_q):
+        loop = asyncio.get_running_loop()
+        while True:
+            name = await in_q.get()
+            if name is _PIPELINE_DONE:
+                await out_q.put(_PIPELINE_DONE)
+                return
+            try:
+                item = await loop.run_in_executor(
+                    None, self._classify_file, src, dsts, name, dry_run, reserved
+                )
+            except Exception as e:
+                item = self._error_item(src, dsts, name, e)
+            await out_q.put(item)
+
+    def _classify_file(self, src, dsts, name, dry_run, reserved):
+        """Decide skip/move/rename for one file in every destination. Returns a pipeline work item."""
+        src_path = os.path.join(src, name)
+        s_name, s_ext, s_size, s_mtime, s_ctime = file_meta(src_path)
+        fan_out = len(dsts) > 1
+
+        item = {"name": name, "src_path": src_path, "ctime": s_ctime, "size": s_size,
+                "bytes_copied": 0, "targets": []}
+        for dst in dsts:
+            taken = reserved[dst]
+            planned_dst_same = os.path.join(dst, name)
+            target = {"dst": dst, "write_to": None, "action": "", "new_name": "", "note": "", "msg": ""}
+
+            if name in taken or os.path.exists(planned_dst_same):
+                if name not in taken and files_identical(src_path, planned_dst_same):
+                    target["action"] = "SKIP"
+                    target["note"] = "Identical metadata"
+                    target["msg"] = (f"SKIP: {name} (identical) "
+                                     f"[ext={s_ext}, size={s_size}, mtime={human_time(s_mtime)}]")
+                else:
+                    new_name = next_available_name(dst, name, taken)
+                    target["new_name"] = new_name
+                    if dry_run:
+                        target["action"] = "DRYRUN_MOVED_RENAMED"
+                        target["note"] = "Different metadata; rename required"
+                        target["msg"] = f"DRYRUN: would move (renamed) {name} → {new_name}"
+                    else:
+                        target["action"] = "MOVED_RENAMED"
+                        target["note"] = "Different metadata; renamed"
+                        target["msg"] = f"MOVED (renamed): {name} → {new_name}"
+                        target["write_to"] = os.path.join(dst, new_name)
+                        taken.add(new_name)
+            else:
+                if dry_run:
+                    target["action"] = "DRYRUN_MOVED"
+                    target["msg"] = f"DRYRUN: would move {name}"
+                else:
+                    target["action"] = "MOVED"
+                    target["msg"] = f"MOVED: {name}"
+                    target["write_to"] = planned_dst_same
+                    taken.add(name)
+
+            if fan_out:
+                target["msg"] += f"  [{dst}]"
+            item["targets"].append(target)
+        return item
+
+    def _error_item(self, src, dsts, name, exc):
+        src_path = os.path.join(src, name)
+        try:
+            _, _, s_size, _, s_ctime = file_meta(src_path)
+        except Exception:
+            s_size, s_ctime = -1, -1
+        item = {"name": name, "src_path": src_path, "ctime": s_ctime, "size": s_size,
+                "bytes_copied": 0, "targets": []}
+        for dst in dsts:
+            target = {"dst": dst, "write_to": None, "action": "", "new_name": "", "note": "", "msg": ""}
+            self._mark_error(target, name, exc, len(dsts) > 1)
+            item["targets"].append(target)
+        return item
+
+    def _mark_error(self, target, name, exc, fan_out):
+        target.update(action="ERROR", new_name="", write_to=None, note=str(exc),
+                      msg=f"ERROR moving {name}: {exc}" + (f"  [{target['dst']}]" if fan_out else ""))
+
+    def _mark_source_kept(self, target, exc):
+        """Fan-out copy landed in this destination but the source could not be removed."""
+        target["action"] = target["action"].replace("MOVED", "COPIED")
+        note = f"Source could not be removed: {exc}"
+        target["note"] = f"{target['note']}; {note}" if target["note"] else note
+        target["msg"] = target["msg"].replace("MOVED", "COPIED", 1) + f" — source kept: {exc}"
+
+    async def _transfer_stage(self, n_dsts, reserved, in_q, out_q):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await in_q.get()
+            if item is _PIPELINE_DONE:
+                await out_q.put(_PIPELINE_DONE)
+                return
+            writes = [t for t in item["targets"] if t["write_to"]]
+            if writes:
+                try:
+                    if len(writes) == 1:
+                        # Only one destination needs the file (the rest skipped it):
+                        # plain move, which is a rename on the same volume
+                        dst_path = writes[0]["write_to"]
+                        renamed = await loop.run_in_executor(
+                            None, same_volume, item["src_path"], os.path.dirname(dst_path)
+                        )
+                        await loop.run_in_executor(None, shutil.move, item["src_path"], dst_path)
+                        if not renamed:
+                            item["bytes_copied"] = max(item["size"], 0)
+                    else:
+                        await self._fan_out_copy(item["src_path"], [t["write_to"] for t in writes])
+                        item["bytes_copied"] = max(item["size"], 0) * len(writes)
+                        try:
+                            await loop.run_in_executor(None, os.remove, item["src_path"])
+                        except Exception as e:
+                            # Every copy is complete and stays (names remain reserved);
+                            # only the source is left behind, e.g. locked on Windows.
+                            for t in writes:
+                                self._mark_source_kept(t, e)
+                except Exception as e:
+                    for t in writes:
+                        reserved[t["dst"]].discard(os.path.basename(t["write_to"]))
+                        self._mark_error(t, item["name"], e, n_dsts > 1)
+            await out_q.put(item)
+
+    async def _fan_out_copy(self, src_path, dst_paths):
+        """
+        Copy src_path to every path in dst_paths, reading the source only once:
+        each chunk is written to all destinations concurrently. Metadata is
+        copied afterwards (copy2 semantics). On failure, partial copies are removed.
+        """
+        loop = asyncio.get_running_loop()
+        run = loop.run_in_executor
+        created = []
+        try:
+            fsrc = await run(None, open, src_path, "rb")
+            try:
+                for path in dst_paths:
+                    # "xb": never clobber a file that appeared since classification
+                    created.append(await run(None, open, path, "xb"))
+                while True:
+                    chunk = await run(None, fsrc.read, FANOUT_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    results = await asyncio.gather(
+                        *(run(None, f.write, chunk) for f in created), return_exceptions=True
+                    )
+                    for r in results:
+                        if isinstance(r, BaseException):
+                            raise r
+            finally:
+                fsrc.close()
+                for f in created:
+                    f.close()
+            for path in dst_paths:
+                await run(None, shutil.copystat, src_path, path)
+        except BaseException:
+            for f in created:
+                try:
+                    os.remove(f.name)
+                except Exception:
+                    pass
+            raise
+
+    async def _log_stage(self, src, ws, dry_run, recorder, in_q, stats):
+        loop = asyncio.get_running_loop()
+        run_mode = "DRY RUN" if dry_run else "LIVE RUN"
+        idx = 0
+        while True:
+            item = await in_q.get()
+            if item is _PIPELINE_DONE:
+                return
+            idx += 1
+            stats["bytes"] += item["bytes_copied"]
+            for target in item["targets"]:
+                action = target["action"]
+                if action == "ERROR":
+                    stats["errors"] += 1
+                elif action == "SKIP":
+                    stats["skipped"] += 1
+                else:
+                    stats["moved"] += 1
+
+                if recorder and not recorder.failed and recorder.add(
+                        time.time(), action, src, target["dst"], item["name"],
+                        target["new_name"], item["size"], target["note"]):
+                    try:
+                        await loop.run_in_executor(None, recorder.flush)
+                    except Exception as e:
+                        recorder.failed = True
+                        self.append_log(f"WARNING: Could not save run history. {e}")
+
+                self.append_log(target["msg"])
+                if ws:
+                    self._write_log_row(ws, src, target["dst"], action, item["name"], target["new_name"],
+                                        item["ctime"], item["size"], target["note"])
+
+            self.progress["value"] = idx
+            self.status_var.set(f"{run_mode}: Processed {idx}/{stats['total']}…")
+
 # ----------------------------
 # Entrypoint
 # ----------------------------